@@ -52,3 +52,72 @@ def test_VECM_against_statsmodels():
     # print("actual: \n")
     # print(new_arr)
     assert_allclose(y_pred, new_arr)
+
+
+@pytest.mark.skipif(
+    not run_test_for_class(VECM),
+    reason="run test only if softdeps are present and incrementally (if requested)",
+)
+@pytest.mark.parametrize("fh", [[1], [1, 3, 4]])
+def test_VECM_predict_interval_against_statsmodels(fh):
+    """Compares Sktime's and Statsmodel's VECM prediction intervals."""
+    from statsmodels.tsa.api import VECM as _VECM
+
+    y = pd.DataFrame(
+        np.random.randint(0, 100, size=(30, 2)).astype(float), columns=list("AB")
+    )
+    fh = ForecastingHorizon(fh)
+    coverage = [0.8, 0.95]
+
+    sktime_model = VECM()
+    sktime_model.fit(y)
+    pred_int = sktime_model.predict_interval(fh=fh, coverage=coverage)
+
+    stats_fit = _VECM(y).fit()
+    fh_idx = fh.to_indexer(sktime_model.cutoff)
+    for c in coverage:
+        _, lower, upper = stats_fit.predict(steps=fh_idx[-1] + 1, alpha=1 - c)
+        for v_idx, var in enumerate(y.columns):
+            assert_allclose(pred_int[(var, c, "lower")], lower[fh_idx, v_idx])
+            assert_allclose(pred_int[(var, c, "upper")], upper[fh_idx, v_idx])
+
+
+@pytest.mark.skipif(
+    not run_test_for_class(VECM),
+    reason="run test only if softdeps are present and incrementally (if requested)",
+)
+def test_VECM_insample_against_statsmodels():
+    """Compares Sktime's in-sample predictions with Statsmodel's fittedvalues."""
+    from statsmodels.tsa.api import VECM as _VECM
+
+    y = pd.DataFrame(
+        np.random.randint(0, 100, size=(30, 2)).astype(float), columns=list("AB")
+    )
+    sktime_model = VECM()
+    sktime_model.fit(y)
+    y_pred = sktime_model.predict(fh=[-3, -2, -1, 0])
+
+    stats_fit = _VECM(y).fit()
+    assert_allclose(y_pred.values, np.asarray(stats_fit.fittedvalues)[-4:])
+
+
+@pytest.mark.skipif(
+    not run_test_for_class(VECM),
+    reason="run test only if softdeps are present and incrementally (if requested)",
+)
+@pytest.mark.parametrize("k_ar_diff", [1, 2])
+def test_VECM_insample_first_points_nan(k_ar_diff):
+    """Test that in-sample predictions for the first k_ar points are nan."""
+    y = pd.DataFrame(
+        np.random.randint(0, 100, size=(30, 2)).astype(float), columns=list("AB")
+    )
+    k_ar = k_ar_diff + 1
+    sktime_model = VECM(k_ar_diff=k_ar_diff)
+    sktime_model.fit(y)
+
+    # relative steps of the first k_ar + 1 training points, and out-of-sample
+    fh_insample = list(range(-29, -29 + k_ar + 1))
+    for fh in [fh_insample, fh_insample + [1, 2]]:
+        y_pred = sktime_model.predict(fh=fh)
+        assert y_pred.iloc[:k_ar].isna().all().all()
+        assert not y_pred.iloc[k_ar:].isna().any().any()
@@ -4,10 +4,14 @@
 __all__ = ["VECM"]
 __author__ = ["thayeylolu", "AurumnPegasus"]
 
+from functools import lru_cache
+
 import numpy as np
 import pandas as pd
+from scipy.stats import norm
 
 from sktime.forecasting.base.adapters import _StatsModelsAdapter
+from sktime.utils.validation.series import is_integer_index
 
 
 class VECM(_StatsModelsAdapter):
@@ -192,23 +196,32 @@ class VECM(_StatsModelsAdapter):
         y_pred_outsample = None
         y_pred_insample = None
         exog_fc = X.values if X is not None else None
-        fh_int = fh.to_relative(self.cutoff)
+        fh_arr, fh_abs, fh_idx = self._get_fh_conversions(fh)
+        fh_max = fh_arr.max()
+        fh_min = fh_arr.min()
 
-        # out-sample prediction
-        if fh_int.max() > 0:
+        # out-sample prediction, only up to the furthest step requested
+        if fh_max > 0:
             y_pred_outsample = self._fitted_forecaster.predict(
-                steps=fh_int[-1],
+                steps=int(fh_max),
                 exog_fc=exog_fc,
                 exog_coint_fc=self.exog_coint_fc,
             )
 
         # in-sample prediction by means of residuals
-        if fh_int.min() <= 0:
-            # .resid returns np.ndarray
-            # both values need to be pd DataFrame for subtraction
-            y_pred_insample = self._y - pd.DataFrame(self._fitted_forecaster.resid)
-            y_pred_insample = y_pred_insample.values
-
+        if fh_min <= 0:
+            # .resid returns np.ndarray, covering only the last nobs time points
+            # as the first k_ar observations are used up as lags;
+            # predictions for these are not available and set to nan,
+            # so that the in-sample block covers all time points in y
+            resid = np.asarray(self._fitted_forecaster.resid, dtype=np.float64)
+            nobs = resid.shape[0]
+            y_pred_insample = np.full(self._y.shape, np.nan)
+            y_pred_insample[-nobs:] = self._y.values[-nobs:] - resid
+
+        # rows are ordered out-of-sample first, then in-sample, so that the
+        # indexer fh_idx (relative step - 1) selects out-of-sample step k at
+        # position k - 1, and in-sample steps by negative positions from the end
         if y_pred_insample is not None and y_pred_outsample is not None:
             y_pred = np.concatenate([y_pred_outsample, y_pred_insample], axis=0)
         else:
@@ -216,12 +229,19 @@ class VECM(_StatsModelsAdapter):
                 y_pred_insample if y_pred_insample is not None else y_pred_outsample
             )
 
-        index = fh.to_absolute_index(self.cutoff)
+        # skip the row selection if fh covers all predicted rows in order
+        if len(fh_idx) != y_pred.shape[0] or np.any(
+            fh_idx != np.arange(y_pred.shape[0])
+        ):
+            y_pred = np.take(y_pred, fh_idx, axis=0)
+
+        index = fh_abs.copy()
         index.name = self._y.index.name
         y_pred = pd.DataFrame(
-            y_pred[fh.to_indexer(self.cutoff), :],
+            y_pred,
             index=index,
             columns=self._y.columns,
+            copy=False,
         )
 
         return y_pred
@@ -263,7 +283,6 @@ class VECM(_StatsModelsAdapter):
                 quantile forecasts at alpha = 0.5 - c/2, 0.5 + c/2 for c in coverage.
         """
         exog_fc = X.values if X is not None else None
-        fh_int = fh.to_relative(self.cutoff)
         var_names = (
             self._y.index.name
             if self._y.index.name is not None
@@ -271,28 +290,110 @@ class VECM(_StatsModelsAdapter):
         )
         int_idx = pd.MultiIndex.from_product([var_names, coverage, ["lower", "upper"]])
 
-        all_values = []  # will store predicted intervals for each coverage value
-        for c in coverage:
-            alpha = 1 - c
-            _, y_lower, y_upper = self._fitted_forecaster.predict(
-                steps=fh_int[-1],
-                exog_fc=exog_fc,
-                exog_coint_fc=self.exog_coint_fc,
-                alpha=alpha,
-            )
-            values = []
-            for v_idx in range(len(var_names)):
-                values.append(y_lower[0][v_idx])
-                values.append(y_upper[0][v_idx])
+        fh_arr, fh_abs, fh_idx = self._get_fh_conversions(fh)
+        y_pred, fc_var = self._predict_mean_var(int(fh_arr.max()), exog_fc)
+        y_pred = y_pred[fh_idx]
+        sigma = np.sqrt(fc_var[fh_idx])
+
+        # point forecast and forecast variances do not depend on the coverage,
+        # all intervals are obtained by scaling with the normal quantiles at once
+        z = _z_from_coverage(tuple(coverage)).reshape(-1, 1, 1)
+        half_width = z * sigma[None, :, :]
+        # shape (n_coverage, n_steps, n_vars, 2), last axis is lower/upper
+        bounds = np.stack([y_pred - half_width, y_pred + half_width], axis=-1)
 
-            all_values.extend(values)
+        # columns of int_idx are ordered as (variable, coverage, lower/upper);
+        # the reshape of the transposed array returns a fresh float64 array,
+        # so the frame can take ownership of it without copying
+        all_values = bounds.transpose(1, 2, 0, 3).reshape(len(fh_arr), -1)
 
         pred_int = pd.DataFrame(
-            [all_values], index=fh.to_absolute_index(self.cutoff), columns=int_idx
+            all_values,
+            index=fh_abs.copy(),
+            columns=int_idx,
+            copy=False,
         )
 
         return pred_int
 
+    def _get_fh_conversions(self, fh):
+        """Return the representations of ``fh`` used in the predict methods.
+
+        The conversions to relative and absolute horizon are memoized
+        by ``ForecastingHorizon``, the indexer is derived from the relative
+        values rather than by a further conversion.
+
+        Parameters
+        ----------
+        fh : ForecastingHorizon
+            The forecasting horizon with the steps ahead to predict.
+
+        Returns
+        -------
+        fh_arr : np.ndarray of int64
+            Steps ahead relative to ``self.cutoff``.
+        fh_abs : pd.Index
+            Absolute representation of ``fh``, relative to ``self.cutoff``.
+        fh_idx : np.ndarray of int64
+            Zero-based indexer, as returned by ``fh.to_indexer(self.cutoff)``.
+
+        Raises
+        ------
+        NotImplementedError
+            If the relative horizon is timedelta-like, as in ``fh.to_indexer``.
+        """
+        fh_rel = fh.to_relative(self.cutoff).to_pandas()
+        if not is_integer_index(fh_rel):
+            msg = (
+                "The indexer for timedelta-like forecasting horizon "
+                "is not yet implemented"
+            )
+            raise NotImplementedError(msg)
+        fh_arr = fh_rel.to_numpy(dtype=np.int64)
+        fh_abs = fh.to_absolute_index(self.cutoff)
+        fh_idx = fh_arr - 1
+        return fh_arr, fh_abs, fh_idx
+
+    def _predict_mean_var(self, steps, exog_fc):
+        """Return point forecast and forecast error variances up to ``steps``.
+
+        Equivalent to the quantities computed internally by statsmodels'
+        ``VECMResults.predict`` when ``alpha`` is passed, but computed once,
+        independently of the interval coverage.
+
+        Parameters
+        ----------
+        steps : int
+            Number of steps ahead to forecast, must be positive.
+        exog_fc : np.ndarray or None
+            Exogeneous data for the forecast period.
+
+        Returns
+        -------
+        y_pred : np.ndarray of shape (steps, neqs)
+            Point forecasts.
+        fc_var : np.ndarray of shape (steps, neqs)
+            Forecast error variances, per step and variable.
+        """
+        from statsmodels.tsa.vector_ar.var_model import ma_rep, mse
+
+        fitted = self._fitted_forecaster
+        y_pred = fitted.predict(
+            steps=steps,
+            exog_fc=exog_fc,
+            exog_coint_fc=self.exog_coint_fc,
+        )
+        if steps == 1:
+            # one step ahead, the forecast error covariance is sigma_u,
+            # as the first MA coefficient is the identity
+            fc_var = np.diag(fitted.sigma_u)[None, :]
+            return y_pred, fc_var
+
+        ma_coefs = ma_rep(fitted.var_rep, steps)
+        fc_cov = mse(ma_coefs, fitted.sigma_u, steps)
+        fc_var = np.diagonal(fc_cov, axis1=1, axis2=2)
+        return y_pred, fc_var
+
     @classmethod
     def get_test_params(cls, parameter_set="default"):
         """Return testing parameter settings for the estimator.
@@ -316,3 +417,23 @@ class VECM(_StatsModelsAdapter):
         params2 = {"k_ar_diff": 2}
 
         return [params1, params2]
+
+
+@lru_cache(maxsize=128)
+def _z_from_coverage(coverage):
+    """Return standard normal quantiles of two-sided intervals at coverage.
+
+    Parameters
+    ----------
+    coverage : tuple of float
+        Nominal coverages of the intervals, floats in [0, 1].
+
+    Returns
+    -------
+    z : 1D np.ndarray of float, read-only, same length as ``coverage``
+        Quantiles ``norm.ppf(0.5 + c / 2)`` for ``c`` in ``coverage``.
+    """
+    z = norm.ppf(0.5 + np.asarray(coverage, dtype=np.float64) / 2)
+    # the result is shared between calls, so guard it against mutation
+    z.setflags(write=False)
+    return z